@@ -4,9 +4,11 @@
 Environment diagnostic script to check Python environment and package availability.
 """
 
+import os
 import sys
 import subprocess
 import importlib.util
+from importlib.metadata import PackageNotFoundError, version
 
 
 def check_python_version():
@@ -46,33 +48,38 @@ def check_package(package_name):
     """Check if a package is available."""
     spec = importlib.util.find_spec(package_name)
     if spec is not None:
+        # Read the version from dist-info metadata; importing heavy packages
+        # like numpy or matplotlib just for __version__ takes hundreds of ms.
         try:
-            module = importlib.import_module(package_name)
-            version = getattr(module, "__version__", "Unknown version")
-            print(f"✓ {package_name}: Available (version: {version})")
-            return True
-        except ImportError as e:
-            print(f"✗ {package_name}: Import failed - {e}")
-            return False
+            pkg_version = version(package_name)
+        except PackageNotFoundError:
+            pkg_version = "Unknown version"
+        print(f"✓ {package_name}: Available (version: {pkg_version})")
+        return True
     else:
         print(f"✗ {package_name}: Not found")
         return False
 
 
-def install_package(package_name):
-    """Attempt to install a package."""
+def install_packages(package_names):
+    """Attempt to install packages with a single pip invocation."""
+    # One pip run resolves everything together and pays the pip startup cost
+    # once; --no-compile skips .pyc generation we don't need here.
+    os.environ.setdefault(
+        "PIP_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pip")
+    )
     try:
-        print(f"Attempting to install {package_name}...")
+        print(f"Attempting to install {', '.join(package_names)}...")
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", package_name],
+            [sys.executable, "-m", "pip", "install", "--no-compile", *package_names],
             capture_output=True,
             text=True,
             check=True,
         )
-        print(f"✓ {package_name} installed successfully")
+        print(f"✓ {', '.join(package_names)} installed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to install {package_name}: {e}")
+        print(f"✗ Failed to install {', '.join(package_names)}: {e}")
         print(f"Error output: {e.stderr}")
         return False
 
@@ -107,8 +114,7 @@ def main():
             input("Attempt to install missing packages? (y/n): ").lower().strip()
         )
         if install_choice == "y":
-            for package in missing_packages:
-                install_package(package)
+            install_packages(missing_packages)
 
             print("\n" + "=" * 60)
             print("RE-CHECKING PACKAGES AFTER INSTALLATION:")
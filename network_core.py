@@ -0,0 +1,263 @@
+# File: network_core.py
+
+"""Shared data and rendering helpers for the micronutrient network scripts."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+# Default destination for the rendered figures, created once at import so
+# render() doesn't have to re-check it before every save.
+DEFAULT_OUTPUT_DIR = Path(".github/resources")
+DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+try:
+    import pygraphviz  # noqa: F401  (needs the Graphviz C libraries)
+
+    HAVE_PYGRAPHVIZ = True
+except ImportError:
+    HAVE_PYGRAPHVIZ = False
+
+try:
+    import rustworkx as rx
+except ImportError:  # optional; NetworkX's Python force loop is the fallback
+    rx = None
+
+# Nodes grouped by function (colors will reflect groups in the coloured variant)
+GROUPS = {
+    "Electrolytes": ("Sodium (Na)", "Potassium (K)", "Phosphorus (P)"),
+    "Bone/Structure": (
+        "Calcium (Ca)",
+        "Magnesium (Mg)",
+        "Fluoride (F)",
+        "Silicon (Si)",
+        "Boron (B)",
+    ),
+    "Blood & Oxygen": ("Iron (Fe)", "Cobalt (Co)", "Copper (Cu)"),
+    "Enzyme Cofactors": (
+        "Zinc (Zn)",
+        "Manganese (Mn)",
+        "Chromium (Cr)",
+        "Molybdenum (Mo)",
+        "Nickel (Ni)",
+        "Vanadium (V)",
+    ),
+    "Thyroid & Hormones": ("Iodine (I)", "Selenium (Se)", "Lithium (Li)"),
+}
+
+NODES = tuple(node for group in GROUPS.values() for node in group)
+
+# Relation edges: (source, target, relation)
+EDGES = (
+    ("Calcium (Ca)", "Iron (Fe)", "inhibits"),
+    ("Calcium (Ca)", "Magnesium (Mg)", "inhibits"),
+    ("Magnesium (Mg)", "Calcium (Ca)", "boosts"),
+    ("Zinc (Zn)", "Copper (Cu)", "inhibits"),
+    ("Zinc (Zn)", "Iron (Fe)", "inhibits"),
+    ("Iron (Fe)", "Zinc (Zn)", "inhibits"),
+    ("Manganese (Mn)", "Iron (Fe)", "inhibits"),
+    ("Molybdenum (Mo)", "Copper (Cu)", "inhibits"),
+    ("Selenium (Se)", "Iodine (I)", "boosts"),
+    ("Iron (Fe)", "Iodine (I)", "boosts"),
+    ("Chromium (Cr)", "Iron (Fe)", "inhibits"),
+    ("Phosphorus (P)", "Calcium (Ca)", "inhibits"),
+    ("Sodium (Na)", "Potassium (K)", "inhibits"),
+    ("Potassium (K)", "Sodium (Na)", "inhibits"),
+    ("Sodium (Na)", "Calcium (Ca)", "inhibits"),
+    ("Potassium (K)", "Calcium (Ca)", "boosts"),
+    ("Boron (B)", "Calcium (Ca)", "boosts"),
+    ("Boron (B)", "Magnesium (Mg)", "boosts"),
+    ("Silicon (Si)", "Calcium (Ca)", "boosts"),
+    ("Fluoride (F)", "Calcium (Ca)", "inhibits"),
+    ("Vanadium (V)", "Iron (Fe)", "inhibits"),
+    ("Nickel (Ni)", "Zinc (Zn)", "inhibits"),
+    ("Cobalt (Co)", "Iron (Fe)", "inhibits"),
+    ("Lithium (Li)", "Iodine (I)", "inhibits"),
+)
+
+
+def build_graph():
+    G = nx.DiGraph()
+    G.add_nodes_from(NODES)
+    for src, tgt, rel in EDGES:
+        G.add_edge(src, tgt, relation=rel)
+    return G
+
+
+def _rustworkx_layout(G, k, seed, iterations):
+    """Run the Fruchterman–Reingold iterations in Rust via rustworkx."""
+    rx_graph = rx.PyDiGraph()
+    idxs = {n: rx_graph.add_node(n) for n in G.nodes}
+    rx_graph.add_edges_from([(idxs[u], idxs[v], None) for u, v in G.edges])
+    raw = rx.spring_layout(rx_graph, k=k, seed=seed, num_iter=iterations)
+    return {n: tuple(raw[i]) for n, i in idxs.items()}
+
+
+def compute_layout(
+    G, k=0.8, seed=42, iterations=20, cache_dir=Path(".cache"), engine=None
+):
+    """Return layout positions, reusing a cached result when the graph,
+    k, seed, iteration count and engine are unchanged.
+
+    The default engine is NetworkX's spring layout so the figures look the
+    same regardless of which optional packages are installed. The faster
+    "sfdp" (Graphviz) and "rustworkx" engines change the geometry, so they
+    are opt-in via the engine argument or NETWORK_LAYOUT_ENGINE.
+    """
+    if engine is None:
+        engine = os.environ.get("NETWORK_LAYOUT_ENGINE", "spring")
+    if engine not in ("spring", "sfdp", "rustworkx"):
+        raise ValueError(f"unknown layout engine: {engine!r}")
+    key = hashlib.sha1(
+        repr((sorted(G.nodes), sorted(G.edges), k, seed, iterations, engine)).encode()
+    ).hexdigest()
+    cache_file = cache_dir / f"layout_{key}.json"
+    if cache_file.exists():
+        try:
+            with cache_file.open() as fh:
+                return {node: tuple(xy) for node, xy in json.load(fh).items()}
+        except (json.JSONDecodeError, OSError):
+            pass  # corrupt or half-written entry; recompute and replace it
+    if engine == "sfdp":
+        if not HAVE_PYGRAPHVIZ:
+            raise RuntimeError("the sfdp engine needs pygraphviz installed")
+        # Graphviz runs its multilevel solver in C; deterministic without a
+        # seed. -Goverlap=scale fails on Graphviz builds without the
+        # triangulation library, which sfdp reports on stderr but swallows —
+        # nodes then end up stacked, so callers opting in should eyeball the
+        # output once.
+        pos = nx.nx_agraph.graphviz_layout(G, prog="sfdp", args="-Goverlap=scale")
+    elif engine == "rustworkx":
+        if rx is None:
+            raise RuntimeError("the rustworkx engine needs rustworkx installed")
+        pos = _rustworkx_layout(G, k=k, seed=seed, iterations=iterations)
+    else:
+        # 20 iterations converge fine at this node count; the default 50 just
+        # burns time in the force loop.
+        pos = nx.spring_layout(
+            G, k=k, seed=seed, iterations=iterations, threshold=1e-3
+        )
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write via a per-process temp file and rename it into place: render_all's
+    # workers may race on a cold cache, and os.replace keeps the entry atomic.
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_file.open("w") as fh:
+        json.dump({node: [float(x), float(y)] for node, (x, y) in pos.items()}, fh)
+    os.replace(tmp_file, cache_file)
+    return pos
+
+
+def render(G, pos, *, coloured, outpath, dpi=150):
+    """Draw the interaction network and save it to outpath.
+
+    With coloured=True, nodes are coloured by functional group and the group
+    legend is added; otherwise the plain single-colour variant is drawn.
+    """
+    # Imported here so that importing network_core for build_graph or
+    # compute_layout alone doesn't pay matplotlib's ~300 ms import cost.
+    import matplotlib as mpl
+    from matplotlib import colormaps
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # file-only rendering
+    from matplotlib.colors import to_hex
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+
+    # Pin matplotlib's bundled font so text rendering never falls into a
+    # font-manager scan, and keep glyph/path handling cheap.
+    mpl.rcParams["font.family"] = "DejaVu Sans"
+    mpl.rcParams["text.hinting"] = "none"
+    mpl.rcParams["path.simplify"] = True
+    mpl.rcParams["path.simplify_threshold"] = 1.0
+
+    if coloured:
+        figsize = (14, 14)
+        node_size = 600
+        node_fontsize = 8.5
+        symbol_fontsize = 11
+        rad = 0.15
+        edge_width = 1.3
+        title = "Micronutrient Interaction Network (Grouped by Biological Role)"
+    else:
+        figsize = (12, 12)
+        node_size = 500
+        node_fontsize = 8
+        symbol_fontsize = 10
+        rad = 0.1
+        edge_width = 1.2
+        title = "Comprehensive Micronutrient Interaction Network"
+
+    # Plain Figure + Agg canvas; skips pyplot's figure-manager state
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot(111)
+
+    node_idx = {n: i for i, n in enumerate(G.nodes())}
+    P = np.array([pos[n] for n in G.nodes()])
+
+    legend_handles = []
+    if coloured:
+        tab10 = colormaps["tab10"]
+        group_colors = {g: to_hex(tab10(i)) for i, g in enumerate(GROUPS)}
+        node_colors = {n: group_colors[g] for g, ns in GROUPS.items() for n in ns}
+        node_color_list = [node_colors[n] for n in NODES]
+        legend_handles += [Patch(color=c, label=g) for g, c in group_colors.items()]
+    else:
+        node_color_list = "#1f78b4"  # draw_networkx_nodes' old default
+
+    # One scatter call replaces draw_networkx_nodes' PathCollection wrapping
+    ax.scatter(P[:, 0], P[:, 1], c=node_color_list, s=node_size, zorder=2)
+
+    # Node labels
+    for node, (x, y) in pos.items():
+        ax.text(x, y, node, fontsize=node_fontsize, ha="center", va="center")
+
+    # Edge styles and labels, batched into one draw call per style
+    solid = [(u, v) for u, v, d in G.edges(data=True) if d["relation"] == "boosts"]
+    dashed = [(u, v) for u, v, d in G.edges(data=True) if d["relation"] == "inhibits"]
+    for edgelist, style in ((solid, "solid"), (dashed, "dashed")):
+        nx.draw_networkx_edges(
+            G,
+            pos,
+            edgelist=edgelist,
+            style=style,
+            connectionstyle=f"arc3,rad={rad}",
+            arrowstyle="-|>",
+            arrowsize=12,
+            width=edge_width,
+            ax=ax,
+        )
+
+    # Midpoints computed in one vectorized pass rather than per-edge dict lookups
+    for edgelist, label in ((solid, "+"), (dashed, "−")):
+        src = np.fromiter((node_idx[u] for u, _ in edgelist), int, count=len(edgelist))
+        tgt = np.fromiter((node_idx[v] for _, v in edgelist), int, count=len(edgelist))
+        for xm, ym in 0.5 * (P[src] + P[tgt]):
+            ax.text(xm, ym, label, fontsize=symbol_fontsize, ha="center", va="center")
+
+    legend_handles += [
+        Line2D([0], [0], linestyle="solid", lw=1.5, color="black", label="Boosts (+)"),
+        Line2D(
+            [0], [0], linestyle="dashed", lw=1.5, color="black", label="Inhibits (−)"
+        ),
+    ]
+    ax.legend(handles=legend_handles, loc="upper left", fontsize=9)
+    ax.set_title(title, fontsize=14)
+    ax.set_axis_off()
+
+    # Fix the extents from the known positions; bbox_inches="tight" would
+    # render the whole figure a second time just to measure them.
+    xpad = 0.08 * np.ptp(P[:, 0])
+    ypad = 0.08 * np.ptp(P[:, 1])
+    ax.set_xlim(P[:, 0].min() - xpad, P[:, 0].max() + xpad)
+    ax.set_ylim(P[:, 1].min() - ypad, P[:, 1].max() + ypad)
+
+    # 150 dpi is plenty for a network diagram and quarters the PNG encode cost
+    dest = Path(outpath)
+    if dest.parent != DEFAULT_OUTPUT_DIR:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+    FigureCanvasAgg(fig).print_figure(str(dest), dpi=dpi)
+    print(f"Figure saved to {dest}")
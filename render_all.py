@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Render every network figure in parallel, one worker process per figure."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from network_core import DEFAULT_OUTPUT_DIR, build_graph, compute_layout, render
+
+
+def render_coloured():
+    G = build_graph()
+    pos = compute_layout(G)
+    render(
+        G,
+        pos,
+        coloured=True,
+        outpath=DEFAULT_OUTPUT_DIR / "micronutrient_network_coloured.png",
+    )
+
+
+def render_elements():
+    G = build_graph()
+    pos = compute_layout(G)
+    render(
+        G,
+        pos,
+        coloured=False,
+        outpath=DEFAULT_OUTPUT_DIR / "micronutrient_network_elements.png",
+    )
+
+
+def render_enhanced():
+    from interaction_network_elements_pretty import main
+
+    main()
+
+
+def main():
+    # The figures share no state (the layout cache is keyed on the graph, so
+    # at worst two cold workers compute the same layout once), and each
+    # process gets its own matplotlib font cache — no contention.
+    jobs = (render_coloured, render_elements, render_enhanced)
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(job) for job in jobs]
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()